@@ -2,8 +2,6 @@ import sys
 from us_visa.logger import logging
 from us_visa.exception import USvisaException
 from us_visa.pipeline.stage_01_data_ingestion_pipe import DataIngestionPipeline
-import matplotlib
-matplotlib.use('Agg')  # Use non-GUI backend to avoid tkinter errors
 
 
 
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
-from pandas import DataFrame
-from sklearn.model_selection import train_test_split
+import hashlib
+import json
+import os
+import numpy as np
+import pyarrow as pa
 import sys
 from us_visa.entity.config_entity import DataIngestionConfig
 from us_visa.entity.artifact_entity import DataIngestionArtifact
 from us_visa.exception import USvisaException
 from us_visa.logger import logging
-from us_visa.utils.main_utils import read_yaml_file
+from us_visa.utils.main_utils import read_yaml_file, load_arrow_schema
 from us_visa.constants import SCHEMA_FILE_PATH
 from us_visa.data_access.stage_01_data_extractor import MongoDataExtractor
 from us_visa.data_access.stage_02_data_cleaner import DataCleaner
@@ -35,61 +39,81 @@ class DataIngestion:
     ) -> None:
         try:
             self.config = config or DataIngestionConfig()
+            self._schema_config = read_yaml_file(SCHEMA_FILE_PATH)
+            self._arrow_schema = load_arrow_schema(SCHEMA_FILE_PATH)
 
             # Dependency injection with fallback to default implementations
             if service is None:
                 mongo_client = MongoDBClient(MongoDBConfig())
-                extractor = MongoDataExtractor(mongo_client)
+                extractor = MongoDataExtractor(
+                    mongo_client, self.config.collection_name, schema=self._arrow_schema
+                )
                 cleaner = DataCleaner()
                 service = DataAccessService(extractor, cleaner)
 
             self.service: DataAccessService = service  
-            self.saver: ParquetDataSaver = saver or ParquetDataSaver()
-            self._schema_config = read_yaml_file(SCHEMA_FILE_PATH)
+            self.saver: ParquetDataSaver = saver or ParquetDataSaver(schema=self._arrow_schema)
 
         except Exception as e:
             logging.error(f"Error initializing DataIngestion: {e}")
             raise USvisaException(e, sys)
 
     # -----------------------------
-    def export_data_into_feature_store(self) -> DataFrame:
+    def export_data_into_feature_store(self) -> pa.Table:
         """
         Fetches and cleans data, then saves it to the feature store.
         """
         try:
-            logging.info("Fetching and cleaning data from source...")
-            df = self.service.get_clean_dataframe(self.config.collection_name)
-
-            if df.empty:
-                raise USvisaException("Extracted dataframe is empty.", sys)
-
-            self.saver.save(df, self.config.feature_store_file_path)
-            logging.info(f"Data saved to feature store: {self.config.feature_store_file_path}")
-            return df
+            table = self._fetch_clean_table()
+            self._save_feature_store(table)
+            return table
 
         except Exception as e:
             logging.error(f"Failed to export data into feature store: {e}")
             raise USvisaException(e, sys)
 
+    def _fetch_clean_table(self) -> pa.Table:
+        logging.info("Fetching and cleaning data from source...")
+        table = self.service.get_clean_table()
+
+        if table.num_rows == 0:
+            raise USvisaException("Extracted table is empty.", sys)
+        return table
+
+    def _save_feature_store(self, table: pa.Table) -> None:
+        self.saver.save(table, self.config.feature_store_file_path)
+        logging.info(f"Data saved to feature store: {self.config.feature_store_file_path}")
+
     # -----------------------------
-    def split_data_as_train_test(self, dataframe: DataFrame) -> None:
+    def split_data_as_train_test(self, table: pa.Table) -> None:
         """
         Splits data into train and test sets and saves them.
         """
         try:
-            drop_columns = self._schema_config.get("drop_columns", [])
+            drop_columns = [
+                col for col in self._schema_config.get("drop_columns", [])
+                if col in table.column_names
+            ]
             if drop_columns:
-                dataframe = dataframe.drop(columns=drop_columns, errors="ignore")
+                # Metadata-only in Arrow: no column data is copied
+                table = table.drop_columns(drop_columns)
                 logging.info(f"Dropped columns: {drop_columns}")
 
-            train_set, test_set = train_test_split(
-                dataframe,
-                test_size=self.config.train_test_split_ratio,
-                random_state=42
-            )
-
-            self.saver.save(train_set, self.config.training_file_path)
-            self.saver.save(test_set, self.config.testing_file_path)
+            # Single random split: a seeded permutation sliced in two
+            rng = np.random.default_rng(42)
+            idx = rng.permutation(table.num_rows)
+            cut = int(table.num_rows * (1 - self.config.train_test_split_ratio))
+            train_set = table.take(idx[:cut])
+            test_set = table.take(idx[cut:])
+
+            # pyarrow releases the GIL while writing, so both datasets are written in parallel
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futures = [
+                    executor.submit(self.saver.save_dataset, train_set, self.config.training_file_path),
+                    executor.submit(self.saver.save_dataset, test_set, self.config.testing_file_path),
+                ]
+                for future in futures:
+                    future.result()
 
             logging.info(f"Train set shape: {train_set.shape}, Test set shape: {test_set.shape}")
 
@@ -97,20 +121,71 @@ class DataIngestion:
             logging.error(f"Failed to split data into train/test sets: {e}")
             raise USvisaException(e, sys)
 
+    # -----------------------------
+    def _build_manifest(self) -> dict:
+        """Schema/config hash, cleaning-query hash and the live source fingerprint."""
+        with open(SCHEMA_FILE_PATH, "rb") as f:
+            schema_sha256 = hashlib.sha256(f.read()).hexdigest()
+        return {
+            "schema_sha256": schema_sha256,
+            "train_test_split_ratio": self.config.train_test_split_ratio,
+            "cleaning_sha256": self.service.get_cleaning_fingerprint(),
+            **self.service.get_source_fingerprint(),
+        }
+
+    def _artifacts_up_to_date(self, manifest: dict) -> bool:
+        paths = [
+            self.config.manifest_file_path,
+            self.config.feature_store_file_path,
+            self.config.training_file_path,
+            self.config.testing_file_path,
+        ]
+        if not all(os.path.exists(path) for path in paths):
+            return False
+        try:
+            with open(self.config.manifest_file_path, "r") as f:
+                return json.load(f) == manifest
+        except (OSError, ValueError):
+            return False
+
+    def _write_manifest(self, manifest: dict) -> None:
+        with open(self.config.manifest_file_path, "w") as f:
+            json.dump(manifest, f, indent=2)
+
     # -----------------------------
     def initiate_data_ingestion(self) -> DataIngestionArtifact:
         """
         Main orchestration method for the data ingestion pipeline.
+
+        Skips extract/clean/write and returns the existing artifact when the
+        manifest next to the feature store matches the current schema file,
+        split ratio, cleaning query and source collection fingerprint.
+
+        The source fingerprint is the document count and newest `_id`, so
+        in-place updates to existing documents are not detected; set
+        `config.force_refresh` (or USVISA_FORCE_INGESTION=1) to re-run anyway.
         """
         try:
-            df = self.export_data_into_feature_store()
-            self.split_data_as_train_test(df)
-
             artifact = DataIngestionArtifact(
                 raw_file_path=self.config.feature_store_file_path,
                 train_file_path=self.config.training_file_path,
                 test_file_path=self.config.testing_file_path
             )
+
+            manifest = self._build_manifest()
+            if not self.config.force_refresh and self._artifacts_up_to_date(manifest):
+                logging.info(f"Ingestion artifacts are up to date, skipping ingestion: {artifact}")
+                return artifact
+
+            table = self._fetch_clean_table()
+
+            # Feature store write overlaps with the column drop, split and train/test writes
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                feature_store_save = executor.submit(self._save_feature_store, table)
+                self.split_data_as_train_test(table)
+                feature_store_save.result()
+
+            self._write_manifest(manifest)
             logging.info(f"Data ingestion artifact created: {artifact}")
             return artifact
 
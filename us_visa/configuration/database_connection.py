@@ -2,6 +2,7 @@
 # # database_connection.py
 # # =========================================
 
+import os
 import sys
 import pymongo
 import certifi
@@ -12,6 +13,7 @@ from pymongo.database import Database
 from us_visa.logger import logging
 from us_visa.exception import USvisaException
 from us_visa.entity.config_entity import MongoDBConfig
+from us_visa.constants import MONGODB_EAGER_CONNECT_KEY
 
 
 
@@ -52,7 +54,13 @@ class MongoDBClient(BaseDatabaseClient):
             if MongoDBClient._shared_client is None:
                 MongoDBClient._shared_client = pymongo.MongoClient(
                     self._config.uri,
-                    tlsCAFile=CA_CERT_PATH
+                    tlsCAFile=CA_CERT_PATH,
+                    compressors=self._config.compressors,
+                    zlibCompressionLevel=self._config.zlib_compression_level,
+                    maxPoolSize=self._config.max_pool_size,
+                    retryReads=True,
+                    connectTimeoutMS=self._config.connect_timeout_ms,
+                    serverSelectionTimeoutMS=self._config.server_selection_timeout_ms,
                 )
                 logging.info("MongoDB connection established successfully.")
             self._client = MongoDBClient._shared_client
@@ -64,8 +72,31 @@ class MongoDBClient(BaseDatabaseClient):
         if self._client is None:
             self.connect()
         return cast(pymongo.MongoClient, self._client)[name or self._config.default_db]
-    
-    
+
+
+# ----------------- Eager connection (opt-in) -----------------
+def _eager_connect() -> Optional[MongoDBClient]:
+    """
+    Opens the shared client and pings the server, so the TLS handshake and
+    topology discovery happen at import time rather than on the first query.
+    Failures are logged and left to the normal lazy connect.
+    """
+    try:
+        client = MongoDBClient(MongoDBConfig())
+        client.connect()
+        cast(pymongo.MongoClient, client._client).admin.command("ping")
+        logging.info("MongoDB connection pre-warmed at import.")
+        return client
+    except Exception as e:
+        logging.warning(f"Eager MongoDB connection failed, falling back to lazy connect: {e}")
+        return None
+
+
+_eager_client: Optional[MongoDBClient] = (
+    _eager_connect() if os.getenv(MONGODB_EAGER_CONNECT_KEY) == "1" else None
+)
+
+
 if __name__ == "__main__":
     try:
         mongo_client = MongoDBClient(MongoDBConfig())
@@ -4,6 +4,7 @@ from datetime import date
 DATABASE_NAME = "insurance"
 COLLECTION_NAME = "data"
 MONGODB_URL_KEY = "MONGODB_URL"
+MONGODB_EAGER_CONNECT_KEY = "USVISA_EAGER_CONNECT"
 
 PIPELINE_NAME: str = "usvisa"
 ARTIFACT_DIR: str = "artifacts"
@@ -11,6 +12,7 @@ ARTIFACT_DIR: str = "artifacts"
 TRAIN_FILE_NAME: str = "train.parquet"
 TEST_FILE_NAME: str = "test.parquet"
 FILE_NAME: str = "raw.parquet"
+MANIFEST_FILE_NAME: str = "raw.manifest.json"
 
 SCHEMA_FILE_PATH: str = os.path.join("config", "schema.yaml")
 
@@ -22,5 +24,6 @@ DATA_INGESTION_DIR_NAME: str = "data_ingestion"
 DATA_INGESTION_FEATURE_STORE_DIR: str = "feature_store"
 DATA_INGESTION_INGESTED_DIR: str = "ingested"
 DATA_INGESTION_TRAIN_TEST_SPLIT_RATIO: float = 0.2
+DATA_INGESTION_FORCE_REFRESH_KEY: str = "USVISA_FORCE_INGESTION"
 
 
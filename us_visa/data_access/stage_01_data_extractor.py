@@ -1,47 +1,157 @@
 import sys
+from functools import cached_property
+from itertools import islice
 from abc import ABC, abstractmethod
 import pandas as pd
-from typing import Optional
+import pyarrow as pa
+from typing import Iterable, List, Optional
+from pymongo.collection import Collection
 
 from us_visa.logger import logging
 from us_visa.configuration.database_connection import MongoDBClient
-from us_visa.constants import COLLECTION_NAME
+from us_visa.constants import COLLECTION_NAME, SCHEMA_FILE_PATH
 from us_visa.configuration.database_connection import MongoDBClient
 from us_visa.entity.config_entity import MongoDBConfig
 from us_visa.exception import USvisaException
+from us_visa.utils.main_utils import read_yaml_file
 
 
-
+# Number of documents buffered per Arrow Table chunk while consuming a cursor
+EXPORT_BATCH_SIZE = 10_000
 
 
 class IDataExtractor(ABC):
     """Interface for all data extractors."""
     
     @abstractmethod
-    def export_as_dataframe(self, collection_name: str, database_name: Optional[str] = None) -> pd.DataFrame:
+    def export_as_table(
+        self,
+        pipeline: Optional[List[dict]] = None,
+        projection: Optional[dict] = None,
+    ) -> pa.Table:
         pass
 
+    def export_as_dataframe(
+        self,
+        pipeline: Optional[List[dict]] = None,
+        projection: Optional[dict] = None,
+    ) -> pd.DataFrame:
+        table = self.export_as_table(pipeline, projection)
+        logging.info("Converted to pandas dataframe...............")
+        # The table is not reused, so Arrow may free its buffers during conversion
+        return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True, split_blocks=True)
+
 
 class MongoDataExtractor(IDataExtractor):
-    """Extracts data from MongoDB collections."""
+    """
+    Extracts data from MongoDB collections.
+
+    Documents are streamed from the cursor in fixed-size chunks, each
+    built column-wise by Arrow, so the collection is never held as a
+    list of Python dicts.
+    """
     
-    def __init__(self, mongo_client: MongoDBClient):
+    def __init__(
+        self,
+        mongo_client: MongoDBClient,
+        collection_name: str,
+        database_name: Optional[str] = None,
+        schema: Optional[pa.Schema] = None,
+    ):
         self.mongo_client = mongo_client
+        self.collection_name = collection_name
+        self.database_name = database_name
+        # When given, extracted columns with these names are cast to these types
+        self.schema = schema
+
+    def export_as_table(
+        self,
+        pipeline: Optional[List[dict]] = None,
+        projection: Optional[dict] = None,
+    ) -> pa.Table:
+        """
+        Exports the collection as an Arrow Table.
+
+        If `pipeline` is given, the collection is read through
+        `aggregate` with those stages appended after the projection;
+        otherwise a plain `find` is used.
 
-    def export_as_dataframe(self, collection_name: str, database_name: Optional[str] = None) -> pd.DataFrame:
+        `projection` defaults to the fields declared in the schema file
+        without `_id`, so undeclared fields never leave the server.
+        """
         try:
-            logging.info("Create connection.................")
-            db = self.mongo_client.get_database(database_name)
-            collection = db[collection_name]
-            logging.info("Converted to pandas dataframe...............")
-            df = pd.DataFrame(list(collection.find()))
-            return df
+            projection = projection or self.default_projection()
+
+            if pipeline is not None:
+                cursor = self.collection.aggregate([{"$project": projection}, *pipeline], allowDiskUse=True)
+            else:
+                cursor = self.collection.find(projection=projection)
+
+            return self._cursor_to_table(cursor)
         except Exception as e:
             raise USvisaException(e, sys)
 
+    @cached_property
+    def collection(self) -> Collection:
+        """Collection handle, resolved once per extractor."""
+        logging.info("Create connection.................")
+        return self.mongo_client.get_database(self.database_name)[self.collection_name]
+
+    def describe_collection(self) -> dict:
+        """
+        Cheap fingerprint of the collection's contents: the metadata document
+        count and the newest `_id` (served from the `_id` index).
+        """
+        try:
+            newest = self.collection.find_one(projection={"_id": 1}, sort=[("_id", -1)])
+            return {
+                "doc_count": self.collection.estimated_document_count(),
+                "mongo_max_id": str(newest["_id"]) if newest else None,
+            }
+        except Exception as e:
+            raise USvisaException(e, sys)
+
+    def default_projection(self) -> dict:
+        """
+        Every field declared in the schema file (`columns` and `drop_columns`)
+        without `_id`. The drop columns are kept so the raw feature store holds
+        full rows and de-duplication can tell apart rows differing only in them.
+        """
+        schema_config = read_yaml_file(SCHEMA_FILE_PATH)
+        columns = dict.fromkeys([*schema_config["columns"], *schema_config.get("drop_columns", [])])
+        return {"_id": 0, **{col: 1 for col in columns}}
+
+    def _cursor_to_table(self, cursor: Iterable[dict]) -> pa.Table:
+        """Consumes the cursor in chunks of EXPORT_BATCH_SIZE documents."""
+        chunks: List[pa.Table] = []
+
+        cursor = iter(cursor)
+        while batch := list(islice(cursor, EXPORT_BATCH_SIZE)):
+            # Inferred per chunk over the fields of all its documents, not just the first
+            chunks.append(pa.Table.from_struct_array(pa.array(batch)))
+
+        if not chunks:
+            return (self.schema or pa.schema([])).empty_table()
+        # Chunks may disagree (missing fields, int vs float, all-null): widen to a common schema
+        return self._apply_schema(pa.concat_tables(chunks, promote_options="permissive"))
+
+    def _apply_schema(self, table: pa.Table) -> pa.Table:
+        """
+        Casts columns declared in the schema to their declared types; other
+        columns keep their inferred types. The cast is safe, so a lossy
+        conversion (e.g. 5.5 into an int column) raises instead of truncating.
+        """
+        if self.schema is None:
+            return table
+        target = pa.schema([
+            self.schema.field(name) if name in self.schema.names else table.schema.field(name)
+            for name in table.column_names
+        ])
+        return table.cast(target)
+
 
 if __name__ == "__main__":
     mongo_client = MongoDBClient(MongoDBConfig())
-    extractor = MongoDataExtractor(mongo_client)
-    df = extractor.export_as_dataframe(COLLECTION_NAME)
+    extractor = MongoDataExtractor(mongo_client, COLLECTION_NAME)
+    df = extractor.export_as_dataframe()
     print(df.head())
\ No newline at end of file
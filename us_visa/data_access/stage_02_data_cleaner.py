@@ -1,9 +1,46 @@
 # src/data_access/data_cleaner.py
 import pandas as pd
 import numpy as np
+from typing import List
+
+# Sentinel strings treated as missing values
+NA_VALUES = ["na"]
+
 
 class DataCleaner:
     """Cleans extracted DataFrames."""
+
+    @staticmethod
+    def aggregation_stages(columns: List[str]) -> List[dict]:
+        """
+        MongoDB aggregation stages equivalent to `replace_na_with_nan`
+        followed by `drop_duplicates`, so cleaning runs server-side.
+
+        The de-duplication key is built from `columns` in that order, so
+        field order in the source documents does not matter and missing
+        fields count as null, as in pandas. Pass every projected field:
+        rows that differ only in a field left out of `columns` are merged.
+        Output documents have exactly these columns.
+        """
+        if not columns:
+            raise ValueError("At least one column is required to de-duplicate rows.")
+
+        return [
+            # NA sentinels -> null, field by field
+            {"$replaceRoot": {"newRoot": {"$arrayToObject": {"$map": {
+                "input": {"$objectToArray": "$$ROOT"},
+                "as": "field",
+                "in": {
+                    "k": "$$field.k",
+                    "v": {"$cond": [{"$in": ["$$field.v", NA_VALUES]}, None, "$$field.v"]},
+                },
+            }}}}},
+            # Row in fixed column order as group key -> one document per distinct row
+            {"$group": {"_id": {col: {"$ifNull": ["$" + col, None]} for col in columns}}},
+            # $group output order is unspecified; sort for a reproducible row order
+            {"$sort": {"_id": 1}},
+            {"$replaceRoot": {"newRoot": "$_id"}},
+        ]
     
     @staticmethod
     def remove_mongo_id(df: pd.DataFrame) -> pd.DataFrame:
@@ -13,7 +50,8 @@ class DataCleaner:
     
     @staticmethod
     def replace_na_with_nan(df: pd.DataFrame) -> pd.DataFrame:
-        return df.replace({"na": np.nan})
+        # Exact matches against the shared sentinel list; regex=False skips pattern handling
+        return df.replace(to_replace=NA_VALUES, value=np.nan, regex=False)
     
     @staticmethod
     def drop_duplicates(df: pd.DataFrame) -> pd.DataFrame:
@@ -1,6 +1,9 @@
 
 import sys
+import hashlib
+import json
 import pandas as pd
+import pyarrow as pa
 from typing import Optional
 
 from us_visa.constants import COLLECTION_NAME
@@ -18,41 +21,56 @@ class DataAccessService:
         self.extractor = extractor
         self.cleaner = cleaner
 
-    def get_clean_dataframe(
-        self, collection_name: str, database_name: Optional[str] = None
-    ) -> pd.DataFrame:
-        """Fetches data from MongoDB and applies cleaning steps."""
+    def get_clean_table(self, projection: Optional[dict] = None) -> pa.Table:
+        """Fetches data from MongoDB with cleaning steps pushed into the query."""
 
         try:
-            logging.info(f"Fetching data from collection '{collection_name}' in database '{database_name or 'default'}'.")
-            df = self.extractor.export_as_dataframe(collection_name, database_name)
-            logging.info(f"Data fetched successfully with {len(df)} rows.")
+            logging.info(
+                f"Fetching data from collection '{self.extractor.collection_name}' "
+                f"in database '{self.extractor.database_name or 'default'}'."
+            )
+            projection = projection or self.extractor.default_projection()
+            columns = [col for col, keep in projection.items() if keep and col != "_id"]
+
+            # NA replacement and de-duplication run inside the MongoDB aggregation
+            table = self.extractor.export_as_table(
+                pipeline=self.cleaner.aggregation_stages(columns),
+                projection=projection,
+            )
+            logging.info(f"Clean data fetched successfully with {table.num_rows} rows.")
+
+            return table
 
-            df = self.cleaner.remove_mongo_id(df)
-            logging.info("MongoDB _id column removed.")
-
-            df = self.cleaner.replace_na_with_nan(df)
-            logging.info("Missing values replaced with NaN.")
+        except Exception as e:
+            logging.error(f"Error while getting clean table: {e}")
+            raise USvisaException(e, sys)
 
-            df = self.cleaner.drop_duplicates(df)
-            logging.info(f"Duplicate rows removed. Final row count: {len(df)}")
+    def get_source_fingerprint(self) -> dict:
+        """Describes the source collection so callers can tell whether it changed."""
+        return self.extractor.describe_collection()
 
-            return df
+    def get_cleaning_fingerprint(self, projection: Optional[dict] = None) -> str:
+        """SHA-256 of the projection and cleaning stages sent to MongoDB."""
+        projection = projection or self.extractor.default_projection()
+        columns = [col for col, keep in projection.items() if keep and col != "_id"]
+        query = {"projection": projection, "stages": self.cleaner.aggregation_stages(columns)}
+        return hashlib.sha256(json.dumps(query, sort_keys=True, default=str).encode()).hexdigest()
 
-        except Exception as e:
-            logging.error(f"Error while getting clean dataframe: {e}")
-            raise USvisaException(e, sys)
+    def get_clean_dataframe(self, projection: Optional[dict] = None) -> pd.DataFrame:
+        """Same as `get_clean_table`, converted to pandas."""
+        table = self.get_clean_table(projection)
+        return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True, split_blocks=True)
 
 
 # ----------------- Main Block (for testing) -----------------
 if __name__ == "__main__":
     try:
         mongo_client = MongoDBClient(MongoDBConfig())
-        extractor = MongoDataExtractor(mongo_client)
+        extractor = MongoDataExtractor(mongo_client, COLLECTION_NAME)
         cleaner = DataCleaner()
 
         service = DataAccessService(extractor, cleaner)
-        df = service.get_clean_dataframe(COLLECTION_NAME)
+        df = service.get_clean_dataframe()
         print("✅ Cleaned DataFrame preview:")
         print(df.head())
 
@@ -28,6 +28,15 @@ class MongoDBConfig:
     uri: str = os.getenv("MONGODB_URL") or ""
     default_db: str = DATABASE_NAME
 
+    # Wire compression, tried in order; PyMongo falls back if the server lacks one
+    compressors: str = "zstd,snappy,zlib"
+    zlib_compression_level: int = 1
+    max_pool_size: int = 50
+
+    # Fail fast instead of PyMongo's 20s/30s defaults
+    connect_timeout_ms: int = 5000
+    server_selection_timeout_ms: int = 5000
+
     def __post_init__(self):
         if not self.uri:
             raise ValueError("MongoDB URL is not set in environment variables.")
@@ -52,12 +61,17 @@ class DataIngestionConfig:
         data_ingestion_dir, DATA_INGESTION_FEATURE_STORE_DIR, FILE_NAME
     )
 
-    # Path to save training dataset
+    # Sidecar recording which schema/source state the feature store was built from
+    manifest_file_path: str = os.path.join(
+        data_ingestion_dir, DATA_INGESTION_FEATURE_STORE_DIR, MANIFEST_FILE_NAME
+    )
+
+    # Directory of the training Parquet dataset
     training_file_path: str = os.path.join(
         data_ingestion_dir, DATA_INGESTION_INGESTED_DIR, TRAIN_FILE_NAME
     )
 
-    # Path to save testing dataset
+    # Directory of the testing Parquet dataset
     testing_file_path: str = os.path.join(
         data_ingestion_dir, DATA_INGESTION_INGESTED_DIR, TEST_FILE_NAME
     )
@@ -67,3 +81,6 @@ class DataIngestionConfig:
 
     # Source collection or table name(for MongoDB or SQL)
     collection_name: str = DATA_INGESTION_COLLECTION_NAME
+
+    # Re-run ingestion even when the manifest says the artifacts are current
+    force_refresh: bool = os.getenv(DATA_INGESTION_FORCE_REFRESH_KEY) == "1"
@@ -1,19 +1,49 @@
 import os, sys
+import functools
+import struct
 import pickle  # Use standard pickle; can switch to dill if required
 import yaml
-from typing import TypeVar, Type, Any
+from typing import TypeVar, Type, Any, Dict, List
 import numpy as np
+import pyarrow as pa
 from us_visa.exception import USvisaException
 from us_visa.logger import logging
 
 T = TypeVar("T")
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+# Maps the type names used in config/schema.yaml to Arrow types
+ARROW_TYPES = {
+    "int": pa.int64(),
+    "float": pa.float64(),
+    "str": pa.string(),
+    "bool": pa.bool_(),
+}
+
+# Pickle protocol 5 supports out-of-band buffers (PEP 574)
+PICKLE_PROTOCOL = 5
+# Sidecar file next to a pickled object holding its out-of-band buffers
+PICKLE_BUFFERS_SUFFIX = ".buffers"
+
+# Arrow schemas already built from a schema YAML file, keyed by file path
+_schema_cache: Dict[str, pa.Schema] = {}
+
 
 # -----------------------------
+@functools.lru_cache(maxsize=32)
 def read_yaml_file(file_path: str) -> dict:
     """
     Reads a YAML file and returns its content as a dictionary.
 
+    Results are cached per path for the life of the process, since config
+    files do not change at runtime. The same dict is returned to every
+    caller, so treat it as read-only.
+
     Args:
         file_path (str): Path to the YAML file.
 
@@ -25,7 +55,7 @@ def read_yaml_file(file_path: str) -> dict:
     """
     try:
         with open(file_path, "r") as yaml_file:
-            content = yaml.safe_load(yaml_file)
+            content = yaml.load(yaml_file, Loader=YamlSafeLoader)
             if not isinstance(content, dict):
                 raise ValueError(f"YAML file {file_path} must contain a mapping at the root.")
             return content
@@ -34,6 +64,50 @@ def read_yaml_file(file_path: str) -> dict:
         raise USvisaException(e, sys)
 
 
+def build_arrow_schema(columns: dict) -> pa.Schema:
+    """
+    Builds an Arrow schema from the `columns` mapping of a schema YAML file.
+
+    Args:
+        columns (dict): Mapping of column name to type name (e.g. ``{"age": "int"}``).
+
+    Returns:
+        pa.Schema: Arrow schema with one nullable field per column, in mapping order.
+
+    Raises:
+        USvisaException: If a column declares an unsupported type name.
+    """
+    try:
+        fields = []
+        for name, type_name in columns.items():
+            if type_name not in ARROW_TYPES:
+                raise ValueError(f"Unsupported type '{type_name}' for column '{name}'.")
+            fields.append(pa.field(name, ARROW_TYPES[type_name]))
+        return pa.schema(fields)
+    except Exception as e:
+        logging.error(f"Failed to build Arrow schema: {e}")
+        raise USvisaException(e, sys)
+
+
+def load_arrow_schema(file_path: str) -> pa.Schema:
+    """
+    Returns the Arrow schema for the `columns` of a schema YAML file,
+    building it on first use and serving it from a module cache afterwards.
+
+    Args:
+        file_path (str): Path to the schema YAML file.
+
+    Returns:
+        pa.Schema: Arrow schema of the declared columns.
+
+    Raises:
+        USvisaException: If the file cannot be read or declares unsupported types.
+    """
+    if file_path not in _schema_cache:
+        _schema_cache[file_path] = build_arrow_schema(read_yaml_file(file_path)["columns"])
+    return _schema_cache[file_path]
+
+
 def write_yaml_file(file_path: str, content: Any, replace: bool = False) -> None:
     """
     Writes a dictionary or other serializable object to a YAML file.
@@ -62,6 +136,10 @@ def save_numpy_array(file_path: str, array: np.ndarray) -> None:
     """
     Saves a NumPy array to a file in binary format.
 
+    Arrays without Python objects are written without pickling, so they can
+    be memory-mapped on load. Object arrays still need pickle and are saved
+    exactly as before.
+
     Args:
         file_path (str): Path to save the array.
         array (np.ndarray): NumPy array to save.
@@ -72,7 +150,7 @@ def save_numpy_array(file_path: str, array: np.ndarray) -> None:
     try:
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         with open(file_path, "wb") as f:
-            np.save(f, array)
+            np.save(f, array, allow_pickle=array.dtype.hasobject)
         logging.info(f"Numpy array saved at {file_path}")
     except Exception as e:
         logging.error(f"Failed to save numpy array at {file_path}: {e}")
@@ -83,6 +161,10 @@ def load_numpy_array(file_path: str) -> np.ndarray:
     """
     Loads a NumPy array from a binary file.
 
+    Arrays without Python objects are memory-mapped read-only, so only the
+    pages that are touched become resident; the result is an `np.memmap`.
+    Object arrays cannot be memory-mapped and are unpickled into memory.
+
     Args:
         file_path (str): Path to the NumPy array file.
 
@@ -93,17 +175,34 @@ def load_numpy_array(file_path: str) -> np.ndarray:
         USvisaException: If loading fails.
     """
     try:
-        with open(file_path, "rb") as f:
-            return np.load(f, allow_pickle=True)
+        if _npy_has_objects(file_path):
+            with open(file_path, "rb") as f:
+                return np.load(f, allow_pickle=True)
+        return np.load(file_path, mmap_mode="r", allow_pickle=False)
     except Exception as e:
         logging.error(f"Failed to load numpy array from {file_path}: {e}")
         raise USvisaException(e, sys)
 
 
+def _npy_has_objects(file_path: str) -> bool:
+    # Only the .npy header is read to find the dtype
+    with open(file_path, "rb") as f:
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            _, _, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            _, _, dtype = np.lib.format.read_array_header_2_0(f)
+    return dtype.hasobject
+
+
 def save_object(file_path: str, obj: Any) -> None:
     """
     Serializes and saves a Python object to a file using pickle.
 
+    Uses protocol 5 with out-of-band buffers: large contiguous buffers
+    (e.g. NumPy arrays inside estimators) are written raw to a
+    `<file_path>.buffers` sidecar instead of being copied into the pickle stream.
+
     Args:
         file_path (str): Path to save the object.
         obj (Any): Python object to save.
@@ -114,8 +213,17 @@ def save_object(file_path: str, obj: Any) -> None:
     logging.info(f"Saving object to {file_path}")
     try:
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        # Remove the previous sidecar first, so a failed save can never pair
+        # the new pickle with old buffers
+        buffers_path = file_path + PICKLE_BUFFERS_SUFFIX
+        if os.path.exists(buffers_path):
+            os.remove(buffers_path)
+
+        buffers: List[pickle.PickleBuffer] = []
         with open(file_path, "wb") as f:
-            pickle.dump(obj, f)  # Use dill.dump(obj, f) if needed
+            pickle.dump(obj, f, protocol=PICKLE_PROTOCOL, buffer_callback=buffers.append)
+        if buffers:
+            _write_pickle_buffers(buffers_path, buffers)
         logging.info(f"Object saved successfully at {file_path}")
     except Exception as e:
         logging.error(f"Failed to save object to {file_path}: {e}")
@@ -126,6 +234,9 @@ def load_object(file_path: str, expected_type: Type[T]) -> T:
     """
     Loads a Python object from a file and ensures it matches the expected type.
 
+    Out-of-band buffers are read back from the `<file_path>.buffers`
+    sidecar when it exists.
+
     Args:
         file_path (str): Path to the object file.
         expected_type (Type[T]): Expected type of the object.
@@ -139,8 +250,10 @@ def load_object(file_path: str, expected_type: Type[T]) -> T:
     """
     logging.info(f"Loading object from {file_path}")
     try:
+        buffers_path = file_path + PICKLE_BUFFERS_SUFFIX
+        buffers = _read_pickle_buffers(buffers_path) if os.path.exists(buffers_path) else None
         with open(file_path, "rb") as f:
-            obj = pickle.load(f)  # Use dill.load(f) if needed
+            obj = pickle.load(f, buffers=buffers)
         if not isinstance(obj, expected_type):
             raise TypeError(f"Expected {expected_type}, got {type(obj)}")
         logging.info(f"Object loaded successfully from {file_path}")
@@ -148,3 +261,28 @@ def load_object(file_path: str, expected_type: Type[T]) -> T:
     except Exception as e:
         logging.error(f"Failed to load object from {file_path}: {e}")
         raise USvisaException(e, sys)
+
+
+def _write_pickle_buffers(file_path: str, buffers: List[pickle.PickleBuffer]) -> None:
+    # Layout: buffer count, each buffer length (uint64 LE), then the raw bytes back to back
+    views = [buf.raw() for buf in buffers]
+    with open(file_path, "wb") as f:
+        f.write(struct.pack(f"<{len(views) + 1}Q", len(views), *(v.nbytes for v in views)))
+        for view in views:
+            f.write(view)
+
+
+def _read_pickle_buffers(file_path: str) -> List[memoryview]:
+    with open(file_path, "rb") as f:
+        (count,) = struct.unpack("<Q", f.read(8))
+        lengths = struct.unpack(f"<{count}Q", f.read(8 * count))
+        # One writable block so unpickled arrays stay writable, sliced without copying
+        data = bytearray(sum(lengths))
+        f.readinto(data)
+
+    views, offset = [], 0
+    whole = memoryview(data)
+    for length in lengths:
+        views.append(whole[offset:offset + length])
+        offset += length
+    return views